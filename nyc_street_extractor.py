@@ -1,222 +1,448 @@
-import geopandas as gpd
-import pandas as pd
-from geopy.geocoders import Nominatim
-from geopy.distance import geodesic
-from shapely.geometry import Point, LineString
-import os
-from datetime import datetime
-import folium
-from folium import plugins
-import xlsxwriter
-import math
-import matplotlib.pyplot as plt
-
-def get_user_input():
-    """Get user input for address and radius"""
-    print("\n=== NYC Street Centerline Extractor ===")
-    address = input("\nPlease enter a NYC address (e.g., '350 5th Ave, New York, NY'): ")
-    while True:
-        try:
-            radius = float(input("\nPlease enter search radius (meters): "))
-            if radius <= 0:
-                print("Radius must be greater than 0.")
-                continue
-            break
-        except ValueError:
-            print("Please enter a valid number.")
-    return address, radius
-
-def geocode_address(address):
-    """Geocode address to coordinates"""
-    geolocator = Nominatim(user_agent="nyc_street_extractor")
-    try:
-        location = geolocator.geocode(address)
-        if location:
-            return Point(location.longitude, location.latitude)
-        else:
-            raise ValueError("Address not found.")
-    except Exception as e:
-        raise Exception(f"Geocoding error: {str(e)}")
-
-def extract_streets(center_point, radius, shapefile_path):
-    """Extract street centerlines within a given radius"""
-    try:
-        print(f"Reading Shapefile: {shapefile_path}")
-        streets = gpd.read_file(shapefile_path)
-        if streets.crs is None:
-            streets.set_crs(epsg=4326, inplace=True)
-        buffer = center_point.buffer(radius / 111000)
-        streets_in_radius = streets[streets.geometry.intersects(buffer)]
-        return streets_in_radius
-    except Exception as e:
-        raise Exception(f"Error extracting street data: {str(e)}")
-
-def convert_coords_to_excel_coords(coords, center_lon, center_lat, scale=100):
-    """Convert longitude/latitude coordinates to Excel cell coordinates"""
-    excel_coords = []
-    for lon, lat in coords:
-        # Calculate offset relative to center point
-        x = (lon - center_lon) * scale
-        y = (lat - center_lat) * scale
-        # Convert to Excel cell coordinates
-        excel_x = int(x + 50)  # 50 is the center X
-        excel_y = int(50 - y)  # 50 is the center Y, Y axis is reversed
-        excel_coords.append((excel_x, excel_y))
-    return excel_coords
-
-def draw_line(worksheet, start_x, start_y, end_x, end_y, format):
-    """Draw a line using cell fill"""
-    dx = abs(end_x - start_x)
-    dy = abs(end_y - start_y)
-    sx = 1 if start_x < end_x else -1
-    sy = 1 if start_y < end_y else -1
-    err = dx - dy
-    x, y = start_x, start_y
-    while True:
-        worksheet.write(y, x, '', format)
-        if x == end_x and y == end_y:
-            break
-        e2 = 2 * err
-        if e2 > -dy:
-            err -= dy
-            x += sx
-        if e2 < dx:
-            err += dx
-            y += sy
-
-def export_streets_to_excel(streets_data, center_point, output_path):
-    """Export street lines as graphics to Excel (using cell fill)"""
-    try:
-        workbook = xlsxwriter.Workbook(output_path)
-        worksheet = workbook.add_worksheet("Street Map")
-        worksheet.set_column(0, 100, 2)
-        for i in range(100):
-            worksheet.set_row(i, 15)
-        title_format = workbook.add_format({
-            'bold': True,
-            'font_size': 14,
-            'align': 'center'
-        })
-        worksheet.merge_range('A1:Z1', "NYC Street Map", title_format)
-        street_format = workbook.add_format({
-            'bg_color': '#0000FF',  # Blue background
-            'border': 0
-        })
-        center_lon, center_lat = center_point.x, center_point.y
-        for idx, row in streets_data.iterrows():
-            if isinstance(row.geometry, LineString):
-                excel_coords = convert_coords_to_excel_coords(
-                    row.geometry.coords, 
-                    center_lon, 
-                    center_lat
-                )
-                for i in range(len(excel_coords) - 1):
-                    start_x, start_y = excel_coords[i]
-                    end_x, end_y = excel_coords[i + 1]
-                    draw_line(worksheet, start_x, start_y, end_x, end_y, street_format)
-        workbook.close()
-        return True
-    except Exception as e:
-        raise Exception(f"Error exporting to Excel: {str(e)}")
-
-def get_shapefile_path():
-    """Get absolute path of the Shapefile"""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    shapefile_path = os.path.join(current_dir, "Centerline_20250522", "geo_export_afeb978c-bd19-430e-9999-6417824a9aae.shp")
-    print(f"\nCurrent working directory: {os.getcwd()}")
-    print(f"Shapefile path: {shapefile_path}")
-    return shapefile_path
-
-def check_shapefile_files(shapefile_path):
-    """Check if all required Shapefile files exist and are accessible"""
-    base_path = os.path.splitext(shapefile_path)[0]
-    required_extensions = ['.shp', '.shx', '.dbf', '.prj']
-    print("\nChecking the following files:")
-    for ext in required_extensions:
-        file_path = base_path + ext
-        print(f"- {file_path}")
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Required file not found: {file_path}")
-        if not os.access(file_path, os.R_OK):
-            raise PermissionError(f"Cannot read file: {file_path}")
-    return True
-
-def visualize_streets(streets_data, center_point, radius, output_path):
-    """Visualize street data as an interactive map"""
-    try:
-        m = folium.Map(location=[center_point.y, center_point.x], zoom_start=15)
-        folium.Circle(
-            location=[center_point.y, center_point.x],
-            radius=radius,
-            color='red',
-            fill=True,
-            fill_opacity=0.2
-        ).add_to(m)
-        for idx, row in streets_data.iterrows():
-            if isinstance(row.geometry, LineString):
-                coords = [[y, x] for x, y in row.geometry.coords]
-                folium.PolyLine(
-                    coords,
-                    color='blue',
-                    weight=2,
-                    opacity=0.8,
-                    popup=row.get('STNAME', 'Unknown Street')
-                ).add_to(m)
-        legend_html = '''
-            <div style="position: fixed; bottom: 50px; left: 50px; z-index: 1000; background-color: white; padding: 10px; border: 2px solid grey; border-radius: 5px;">
-                <p><strong>Legend</strong></p>
-                <p><span style="color: red;">●</span> Search Radius</p>
-                <p><span style="color: blue;">━</span> Street</p>
-            </div>
-        '''
-        m.get_root().html.add_child(folium.Element(legend_html))
-        m.save(output_path)
-        return True
-    except Exception as e:
-        raise Exception(f"Error generating map: {str(e)}")
-
-def export_streets_to_svg(streets_data, output_path):
-    """Export street lines as SVG vector image (no basemap, no axes)"""
-    try:
-        fig, ax = plt.subplots(figsize=(8, 8))
-        ax.axis('off')
-        for idx, row in streets_data.iterrows():
-            if isinstance(row.geometry, LineString):
-                x, y = row.geometry.xy
-                ax.plot(x, y, color='blue', linewidth=1)
-        plt.savefig(output_path, format='svg', bbox_inches='tight', pad_inches=0, transparent=True)
-        plt.close(fig)
-        return True
-    except Exception as e:
-        raise Exception(f"Error exporting SVG: {str(e)}")
-
-def main():
-    try:
-        address, radius = get_user_input()
-        print("\nGeocoding address...")
-        center_point = geocode_address(address)
-        shapefile_path = get_shapefile_path()
-        print("\nChecking Shapefile files...")
-        check_shapefile_files(shapefile_path)
-        print("\nExtracting street data...")
-        streets_data = extract_streets(center_point, radius, shapefile_path)
-        if len(streets_data) == 0:
-            print("\nNo streets found within the specified radius.")
-            return
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        map_file = f"street_map_{timestamp}.html"
-        svg_file = f"street_lines_{timestamp}.svg"
-        print("\nGenerating interactive map...")
-        visualize_streets(streets_data, center_point, radius, map_file)
-        print("\nExporting SVG street lines...")
-        export_streets_to_svg(streets_data, svg_file)
-        print(f"\nSuccess!")
-        print(f"Map saved to: {map_file}")
-        print(f"SVG street lines saved to: {svg_file}")
-        print(f"Total {len(streets_data)} streets found.")
-        print("\nInsert the SVG file into Excel and ungroup to get editable street line vectors.")
-    except Exception as e:
-        print(f"\nError: {str(e)}")
-
-if __name__ == "__main__":
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from geopy.geocoders import Nominatim
+from geopy.distance import geodesic
+import shapely
+from shapely.geometry import Point
+import os
+import json
+from datetime import datetime
+import folium
+from folium import plugins
+import xlsxwriter
+import math
+from PIL import Image, ImageDraw
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the pure-Python loop still works
+    def njit(func):
+        return func
+
+try:
+    from joblib import Parallel, delayed
+except ImportError:  # joblib is optional; rasterization falls back to serial
+    Parallel = None
+
+# Below this many streets the process pool costs more than it saves
+PARALLEL_RASTER_THRESHOLD = 500
+
+def get_user_input():
+    """Get user input for address and radius"""
+    print("\n=== NYC Street Centerline Extractor ===")
+    address = input("\nPlease enter a NYC address (e.g., '350 5th Ave, New York, NY'): ")
+    while True:
+        try:
+            radius = float(input("\nPlease enter search radius (meters): "))
+            if radius <= 0:
+                print("Radius must be greater than 0.")
+                continue
+            break
+        except ValueError:
+            print("Please enter a valid number.")
+    return address, radius
+
+def get_geocode_cache_path():
+    """Get path of the persistent geocoding cache file"""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_dir, "geocode_cache.json")
+
+def geocode_address(address):
+    """Geocode address to coordinates, using a persistent on-disk cache"""
+    cache_path = get_geocode_cache_path()
+    cache_key = address.strip().lower()
+    cache = {}
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r") as f:
+                cache = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            cache = {}
+    if cache_key in cache:
+        lon, lat = cache[cache_key]
+        return Point(lon, lat)
+    geolocator = Nominatim(user_agent="nyc_street_extractor")
+    try:
+        location = geolocator.geocode(address)
+        if location:
+            cache[cache_key] = [location.longitude, location.latitude]
+            try:
+                with open(cache_path, "w") as f:
+                    json.dump(cache, f, indent=2)
+            except OSError:
+                pass  # cache is best-effort; a failed write should not abort
+            return Point(location.longitude, location.latitude)
+        else:
+            raise ValueError("Address not found.")
+    except Exception as e:
+        raise Exception(f"Geocoding error: {str(e)}")
+
+def extract_streets(center_point, radius, shapefile_path):
+    """Extract street centerlines within a given radius"""
+    try:
+        # Read only features overlapping the search window; the bbox lets
+        # the reader skip the rest of the citywide dataset entirely.
+        # Pad the degree conversion slightly so edge streets are not missed.
+        dy = radius / 111000 * 1.1
+        dx = radius / (111000 * math.cos(math.radians(center_point.y))) * 1.1
+        bbox = (center_point.x - dx, center_point.y - dy,
+                center_point.x + dx, center_point.y + dy)
+        parquet_path = os.path.splitext(shapefile_path)[0] + ".parquet"
+        if os.path.exists(parquet_path):
+            print(f"Reading GeoParquet: {parquet_path}")
+            try:
+                streets = gpd.read_parquet(parquet_path, bbox=bbox)
+            except TypeError:
+                # Older GeoPandas without bbox pushdown for Parquet
+                streets = gpd.read_parquet(parquet_path)
+            except ValueError:
+                # Parquet file written without a covering bbox column
+                streets = gpd.read_parquet(parquet_path)
+        else:
+            print(f"Reading Shapefile: {shapefile_path}")
+            streets = gpd.read_file(shapefile_path, bbox=bbox, engine="pyogrio")
+        if streets.crs is None:
+            streets.set_crs(epsg=4326, inplace=True)
+        # Reproject to NY State Plane (EPSG:2263, feet) so the buffer is a
+        # true circle of the requested radius instead of a degree approximation
+        streets_metric = streets.to_crs(epsg=2263)
+        center_metric = gpd.GeoSeries([center_point], crs=4326).to_crs(epsg=2263).iloc[0]
+        buffer = center_metric.buffer(radius * 3.28084)  # meters to feet
+        # The R-tree prunes far-away candidates on their bounding boxes
+        # before the exact intersects test runs
+        hits = streets_metric.sindex.query(buffer, predicate='intersects')
+        streets_in_radius = streets_metric.iloc[hits]
+        # Clip to the circle so long avenues do not drag vertices far
+        # outside the map window into every exporter
+        streets_in_radius = gpd.clip(streets_in_radius, buffer)
+        # Explode multi-part geometries (clipping also creates them) so the
+        # exporters can assume plain LineStrings instead of silently
+        # dropping MultiLineString rows
+        streets_in_radius = streets_in_radius.explode(index_parts=False)
+        streets_in_radius = streets_in_radius[streets_in_radius.geom_type == 'LineString']
+        return streets_in_radius.to_crs(epsg=4326)
+    except Exception as e:
+        raise Exception(f"Error extracting street data: {str(e)}")
+
+def convert_coords_to_excel_coords(coords, center_lon, center_lat, scale=100):
+    """Convert longitude/latitude coordinates to Excel cell coordinates"""
+    arr = np.asarray(coords)
+    # Offset relative to center point, scaled; 50 is the grid center,
+    # Y axis is reversed in Excel
+    excel_x = ((arr[:, 0] - center_lon) * scale + 50).astype(np.int32)
+    excel_y = (50 - (arr[:, 1] - center_lat) * scale).astype(np.int32)
+    return list(zip(excel_x.tolist(), excel_y.tolist()))
+
+def get_line_coords(lines):
+    """Get one coordinate array per line from a geometry array
+
+    Pulls all vertices out of GEOS in a single get_coordinates call and
+    splits the combined buffer by line, instead of iterating .coords per
+    geometry."""
+    coords, line_idx = shapely.get_coordinates(lines, return_index=True)
+    if len(coords) == 0:
+        return []
+    return np.split(coords, np.flatnonzero(np.diff(line_idx)) + 1)
+
+def dedupe_pixel_coords(pts):
+    """Drop repeated and colinear intermediate pixel coordinates
+
+    After rounding to the Excel grid, consecutive vertices often land on
+    the same cell or continue in a straight line; collapsing them keeps
+    the rasterizer from redrawing the same pixels."""
+    if len(pts) < 2:
+        return pts
+    kept = [pts[0]]
+    for p in pts[1:]:
+        if p[0] == kept[-1][0] and p[1] == kept[-1][1]:
+            continue
+        if len(kept) >= 2:
+            ax, ay = kept[-2]
+            bx, by = kept[-1]
+            cross = (bx - ax) * (p[1] - by) - (by - ay) * (p[0] - bx)
+            dot = (bx - ax) * (p[0] - bx) + (by - ay) * (p[1] - by)
+            # Colinear and continuing forward: extend the previous segment
+            if cross == 0 and dot > 0:
+                kept[-1] = p
+                continue
+        kept.append(p)
+    return np.asarray(kept, dtype=np.int32)
+
+@njit
+def rasterize_segments(segments, grid):
+    """Rasterize (start_x, start_y, end_x, end_y) segments into a grid
+    using Bresenham's algorithm"""
+    size_y, size_x = grid.shape
+    for i in range(segments.shape[0]):
+        start_x = segments[i, 0]
+        start_y = segments[i, 1]
+        end_x = segments[i, 2]
+        end_y = segments[i, 3]
+        dx = abs(end_x - start_x)
+        dy = abs(end_y - start_y)
+        sx = 1 if start_x < end_x else -1
+        sy = 1 if start_y < end_y else -1
+        err = dx - dy
+        x, y = start_x, start_y
+        while True:
+            if 0 <= x < size_x and 0 <= y < size_y:
+                grid[y, x] = 1
+            if x == end_x and y == end_y:
+                break
+            e2 = 2 * err
+            if e2 > -dy:
+                err -= dy
+                x += sx
+            if e2 < dx:
+                err += dx
+                y += sy
+
+def simplify_streets(streets_data, tolerance=0.00005):
+    """Simplify street geometries to drop sub-pixel vertices before export"""
+    simplified = streets_data.copy()
+    simplified['geometry'] = streets_data.geometry.simplify(
+        tolerance, preserve_topology=False)
+    return simplified
+
+def rasterize_street_coords(line_coords_list, center_lon, center_lat):
+    """Rasterize a list of street coordinate arrays into a fresh grid"""
+    grid = np.zeros((100, 100), dtype=np.uint8)
+    segment_chunks = []
+    for line_coords in line_coords_list:
+        pts = np.asarray(convert_coords_to_excel_coords(
+            line_coords,
+            center_lon,
+            center_lat
+        ), dtype=np.int32)
+        pts = dedupe_pixel_coords(pts)
+        if len(pts) >= 2:
+            segment_chunks.append(np.hstack((pts[:-1], pts[1:])))
+    if segment_chunks:
+        rasterize_segments(np.vstack(segment_chunks), grid)
+    return grid
+
+def export_streets_to_excel(streets_data, center_point, output_path):
+    """Export street lines as graphics to Excel (using cell fill)"""
+    try:
+        streets_data = simplify_streets(streets_data)
+        # constant_memory flushes each finished row to disk, so memory stays
+        # flat no matter how many cells get filled; rows must then be
+        # written top to bottom (np.nonzero already yields them in order)
+        # and merged ranges are unavailable, so the title is a plain cell
+        workbook = xlsxwriter.Workbook(output_path, {'constant_memory': True})
+        worksheet = workbook.add_worksheet("Street Map")
+        worksheet.set_column(0, 100, 2)
+        worksheet.set_default_row(15)
+        title_format = workbook.add_format({
+            'bold': True,
+            'font_size': 14,
+            'align': 'center'
+        })
+        worksheet.write(0, 0, "NYC Street Map", title_format)
+        street_format = workbook.add_format({
+            'bg_color': '#0000FF',  # Blue background
+            'border': 0
+        })
+        center_lon, center_lat = center_point.x, center_point.y
+        # Rasterize all segments into one bitmap, then write only the set
+        # cells; each worksheet.write allocates a cell object, so the grid
+        # keeps that cost at O(cells drawn) instead of O(segment length)
+        lines = streets_data.geometry.values
+        line_coords_list = get_line_coords(lines)
+        if Parallel is not None and len(line_coords_list) >= PARALLEL_RASTER_THRESHOLD:
+            # Each worker rasterizes its own partial grid; merging bitmaps
+            # with OR is cheap compared to the per-street work
+            n_chunks = os.cpu_count() or 1
+            chunks = [line_coords_list[i::n_chunks] for i in range(n_chunks)]
+            grids = Parallel(n_jobs=-1)(
+                delayed(rasterize_street_coords)(chunk, center_lon, center_lat)
+                for chunk in chunks if chunk)
+            grid = np.bitwise_or.reduce(grids)
+        else:
+            grid = rasterize_street_coords(line_coords_list, center_lon, center_lat)
+        ys, xs = np.nonzero(grid)
+        for y, x in zip(ys.tolist(), xs.tolist()):
+            worksheet.write(y, x, '', street_format)
+        workbook.close()
+        return True
+    except Exception as e:
+        raise Exception(f"Error exporting to Excel: {str(e)}")
+
+def get_shapefile_path():
+    """Get absolute path of the Shapefile"""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    shapefile_path = os.path.join(current_dir, "Centerline_20250522", "geo_export_afeb978c-bd19-430e-9999-6417824a9aae.shp")
+    print(f"\nCurrent working directory: {os.getcwd()}")
+    print(f"Shapefile path: {shapefile_path}")
+    return shapefile_path
+
+def convert_shapefile_to_parquet(shapefile_path):
+    """Convert the Shapefile to GeoParquet once for faster subsequent reads"""
+    parquet_path = os.path.splitext(shapefile_path)[0] + ".parquet"
+    if os.path.exists(parquet_path):
+        return parquet_path
+    print(f"Converting Shapefile to GeoParquet (one-time): {parquet_path}")
+    streets = gpd.read_file(shapefile_path, engine="pyogrio")
+    if streets.crs is None:
+        streets.set_crs(epsg=4326, inplace=True)
+    try:
+        # The covering bbox column is what lets read_parquet push the bbox
+        # filter down to Parquet row groups
+        streets.to_parquet(parquet_path, write_covering_bbox=True)
+    except TypeError:
+        # Older GeoPandas without the write_covering_bbox option
+        streets.to_parquet(parquet_path)
+    return parquet_path
+
+def check_shapefile_files(shapefile_path):
+    """Check if all required Shapefile files exist and are accessible"""
+    base_path = os.path.splitext(shapefile_path)[0]
+    required_extensions = ['.shp', '.shx', '.dbf', '.prj']
+    print("\nChecking the following files:")
+    for ext in required_extensions:
+        file_path = base_path + ext
+        print(f"- {file_path}")
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Required file not found: {file_path}")
+        if not os.access(file_path, os.R_OK):
+            raise PermissionError(f"Cannot read file: {file_path}")
+    return True
+
+def visualize_streets(streets_data, center_point, radius, output_path):
+    """Visualize street data as an interactive map"""
+    try:
+        # Canvas rendering draws all polylines in one pass instead of one
+        # SVG DOM node per street
+        m = folium.Map(location=[center_point.y, center_point.x], zoom_start=15,
+                       prefer_canvas=True)
+        folium.Circle(
+            location=[center_point.y, center_point.x],
+            radius=radius,
+            color='red',
+            fill=True,
+            fill_opacity=0.2
+        ).add_to(m)
+        # One GeoJson layer for all streets: a single JS object instead of
+        # one Leaflet child per street, which keeps the HTML small and the
+        # browser render fast on dense radii
+        lines = streets_data
+        columns = ['geometry']
+        tooltip = None
+        if 'STNAME' in lines.columns:
+            columns.append('STNAME')
+            tooltip = folium.GeoJsonTooltip(fields=['STNAME'], labels=False)
+        folium.GeoJson(
+            lines[columns],
+            style_function=lambda feature: {
+                'color': 'blue',
+                'weight': 2,
+                'opacity': 0.8
+            },
+            tooltip=tooltip
+        ).add_to(m)
+        legend_html = '''
+            <div style="position: fixed; bottom: 50px; left: 50px; z-index: 1000; background-color: white; padding: 10px; border: 2px solid grey; border-radius: 5px;">
+                <p><strong>Legend</strong></p>
+                <p><span style="color: red;">●</span> Search Radius</p>
+                <p><span style="color: blue;">━</span> Street</p>
+            </div>
+        '''
+        m.get_root().html.add_child(folium.Element(legend_html))
+        m.save(output_path)
+        return True
+    except Exception as e:
+        raise Exception(f"Error generating map: {str(e)}")
+
+def export_streets_to_svg(streets_data, output_path, size=800):
+    """Export street lines as SVG vector image (no basemap, no axes)"""
+    try:
+        minx, miny, maxx, maxy = streets_data.total_bounds
+        span = max(maxx - minx, maxy - miny)
+        if span == 0:
+            span = 1e-9
+        margin = 10
+        scale = (size - 2 * margin) / span
+        width = (maxx - minx) * scale + 2 * margin
+        height = (maxy - miny) * scale + 2 * margin
+        # Emit one <polyline> per street straight from the coordinate
+        # arrays; no Figure, Axes, or renderer in between
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="0 0 {width:.2f} {height:.2f}">'
+        ]
+        for line_coords in get_line_coords(streets_data.geometry.values):
+            xs = (line_coords[:, 0] - minx) * scale + margin
+            # SVG y grows downward, so flip latitude
+            ys = (maxy - line_coords[:, 1]) * scale + margin
+            points = " ".join(f"{x:.2f},{y:.2f}"
+                              for x, y in zip(xs.tolist(), ys.tolist()))
+            parts.append(f'<polyline points="{points}" fill="none" '
+                         f'stroke="blue" stroke-width="1"/>')
+        parts.append('</svg>')
+        with open(output_path, "w") as f:
+            f.write("\n".join(parts))
+        return True
+    except Exception as e:
+        raise Exception(f"Error exporting SVG: {str(e)}")
+
+def export_streets_to_png(streets_data, output_path, size=800):
+    """Export street lines as an anti-aliased PNG raster image"""
+    try:
+        img = Image.new("RGB", (size, size), "white")
+        draw = ImageDraw.Draw(img)
+        minx, miny, maxx, maxy = streets_data.total_bounds
+        span = max(maxx - minx, maxy - miny)
+        if span == 0:
+            span = 1e-9
+        margin = 10
+        scale = (size - 2 * margin) / span
+        center_x = (minx + maxx) / 2
+        center_y = (miny + maxy) / 2
+        half = size / 2
+        lines = streets_data.geometry.values
+        for line_coords in get_line_coords(lines):
+            # Pillow's Agg-backed line drawing rasterizes each polyline in C
+            xs = (line_coords[:, 0] - center_x) * scale + half
+            ys = half - (line_coords[:, 1] - center_y) * scale
+            draw.line(list(zip(xs.tolist(), ys.tolist())), fill="blue", width=1)
+        img.save(output_path)
+        return True
+    except Exception as e:
+        raise Exception(f"Error exporting PNG: {str(e)}")
+
+def main():
+    try:
+        address, radius = get_user_input()
+        print("\nGeocoding address...")
+        center_point = geocode_address(address)
+        shapefile_path = get_shapefile_path()
+        print("\nChecking Shapefile files...")
+        check_shapefile_files(shapefile_path)
+        convert_shapefile_to_parquet(shapefile_path)
+        print("\nExtracting street data...")
+        streets_data = extract_streets(center_point, radius, shapefile_path)
+        if len(streets_data) == 0:
+            print("\nNo streets found within the specified radius.")
+            return
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        map_file = f"street_map_{timestamp}.html"
+        svg_file = f"street_lines_{timestamp}.svg"
+        png_file = f"street_lines_{timestamp}.png"
+        print("\nGenerating interactive map...")
+        visualize_streets(streets_data, center_point, radius, map_file)
+        print("\nExporting SVG street lines...")
+        export_streets_to_svg(simplify_streets(streets_data), svg_file)
+        print("\nExporting PNG street lines...")
+        export_streets_to_png(streets_data, png_file)
+        print(f"\nSuccess!")
+        print(f"Map saved to: {map_file}")
+        print(f"SVG street lines saved to: {svg_file}")
+        print(f"PNG street lines saved to: {png_file}")
+        print(f"Total {len(streets_data)} streets found.")
+        print("\nInsert the SVG file into Excel and ungroup to get editable street line vectors.")
+    except Exception as e:
+        print(f"\nError: {str(e)}")
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file